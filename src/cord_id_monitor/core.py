@@ -1,20 +1,26 @@
-import threading
+import os
+import sys
 import logging
-import time
+from functools import cached_property
 from typing import Optional, List, Callable, Dict
 import pyudev
+from gi.repository import GLib
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# Configure logging (CORDID_DEBUG=1 also shows per-event debug messages)
+logging.basicConfig(level=logging.DEBUG if os.environ.get('CORDID_DEBUG') == '1' else logging.INFO,
+                    format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 class USBDevice:
     """
     Represents a snapshot of a USB Device's state.
     """
+    # sys_path -> {attr: value}. A plugged-in device's sysfs attributes only change
+    # alongside a udev event, and DeviceManager invalidates the path on every event.
+    _sysfs_cache: Dict[str, Dict[str, str]] = {}
+
     def __init__(self, udev_device: pyudev.Device):
         self._device = udev_device
-        self._forced_stable_id = None
         
         # Core Identifiers
         self.sys_path = udev_device.sys_path
@@ -28,60 +34,110 @@ class USBDevice:
         self.vid = udev_device.get('ID_VENDOR_ID', '----')
         self.pid = udev_device.get('ID_MODEL_ID', '----')
         self.bus_num = udev_device.get('BUSNUM', '?')
-        self.dev_num = udev_device.get('DEVNUM', '?')
-        
-        # Topology
-        self.dev_path = udev_device.get('DEVPATH', '') # internal kernel path
         
         # Connection Stats (May not be present if disconnected/unbound, but usually cached in udev db)
         # Note: For real-time speed, we often need to read sysfs directly, 
         # as udev properties might be stale until an event fires.
         self.speed = self._read_sysfs_attr('speed')
+        # Parsed once. Non-integral speeds ("N/A", low speed "1.5") have no Mbps tier
+        self.speed_int: Optional[int] = int(self.speed) if self.speed.isdigit() else None
+        # version is logged with every event, so it is read while the event is fresh.
+        # The rest is only shown by the monitoring page, see the cached properties below.
         self.version = self._read_sysfs_attr('version')
-        self.max_power = self._read_sysfs_attr('bMaxPower')
-        self.num_interfaces = self._read_sysfs_attr('bNumInterfaces')
+        
+        # Identity is fixed for the snapshot: compute once and intern it, so the many
+        # dict lookups keyed by it compare by identity first
+        self.stable_id = sys.intern(self._compute_stable_id())
+        
+        # Same for the display name. A name is unknown when it still reads "Unknown"
+        # or, with no vendor/model strings at all, shows no VID:PID either.
+        self.friendly_name = self._compute_friendly_name()
+        if self.vendor == 'Unknown' and self.model == 'Unknown':
+            self.is_unknown_name = self.vid == '----' and self.pid == '----'
+        else:
+            self.is_unknown_name = self.vendor == 'Unknown' or self.model == 'Unknown'
+
+    # Rarely used fields, read on first access. Listing devices never touches them.
+    @cached_property
+    def dev_num(self) -> str:
+        return self._device.get('DEVNUM', '?')
+
+    @cached_property
+    def dev_path(self) -> str:
+        # Topology: internal kernel path
+        return self._device.get('DEVPATH', '')
+
+    @cached_property
+    def max_power(self) -> str:
+        return self._read_sysfs_attr('bMaxPower')
+
+    @cached_property
+    def num_interfaces(self) -> str:
+        return self._read_sysfs_attr('bNumInterfaces')
+
+    @classmethod
+    def invalidate_sysfs_cache(cls, sys_path: Optional[str] = None):
+        """Drops cached attributes for one device path, or all of them."""
+        if sys_path is None:
+            cls._sysfs_cache.clear()
+        else:
+            cls._sysfs_cache.pop(sys_path, None)
 
     def _read_sysfs_attr(self, attr: str) -> str:
-        """Helper to read sysfs attributes directly for freshest data."""
+        """Helper to read sysfs attributes directly, cached until the next udev event."""
+        cached = self._sysfs_cache.get(self.sys_path)
+        if cached is not None and attr in cached:
+            return cached[attr]
         try:
             # udev_device.sys_path points to /sys/devices/...
-            with open(f"{self.sys_path}/{attr}", 'r') as f:
-                return f.read().strip()
-        except (IOError, FileNotFoundError, AttributeError):
-            # Fallback to udev properties if file read fails
-            return self._device.properties.get(attr.upper(), 'N/A')
-
-    @property
-    def stable_id(self) -> str:
+            # Raw fd read: sysfs values are tiny, so skip the buffered file object
+            fd = os.open(f"{self.sys_path}/{attr}", os.O_RDONLY)
+            try:
+                value = os.read(fd, 256).decode(errors='replace').strip()
+            finally:
+                os.close(fd)
+        except OSError:
+            # Not cached. udev has no properties for these sysfs attributes, so there
+            # is nothing worth loading the property list for.
+            return 'N/A'
+        self._sysfs_cache.setdefault(self.sys_path, {})[attr] = value
+        return value
+
+    def _compute_stable_id(self) -> str:
         """
         Returns a unique identifier for this device.
         Strategy:
         1. Serial Number (Best)
         2. Vendor:Model + Physical Port Path (Fallback)
         """
-        if self._forced_stable_id:
-            return self._forced_stable_id
-
         if self.serial:
-            return f"SERIAL:{self.serial}"
+            return "SERIAL:" + self.serial
         
         # Fallback: Use VID:PID + sys_name (kernel name roughly maps to topology 1-1.2)
         # We strip the device number parts if they fluctuate, but typically sys_name like '1-2' is bus-port.
-        return f"PATH:{self.vid}:{self.pid}:{self.sys_name}"
+        return "PATH:" + ":".join((self.vid, self.pid, self.sys_name))
 
-    def get_friendly_name(self) -> str:
+    def force_stable_id(self, stable_id: str):
+        """Overrides the computed identity, e.g. with the one a device had before it was removed."""
+        self.stable_id = sys.intern(stable_id)
+
+    def _compute_friendly_name(self) -> str:
         name = f"{self.vendor} {self.model}".strip()
         if name == "Unknown Unknown":
             name = f"USB Device ({self.vid}:{self.pid})"
         return name.replace('_', ' ')
 
+    def get_friendly_name(self) -> str:
+        return self.friendly_name
+
     def __repr__(self):
-        return f"<USBDevice {self.get_friendly_name()} [{self.stable_id}]>"
+        return f"<USBDevice {self.friendly_name} [{self.stable_id}]>"
 
 
 class DeviceManager:
     """
     Manages USB device enumeration and monitoring.
+    Events are read on the GLib main loop, so callbacks run on the main thread.
     """
     def __init__(self, on_device_event: Optional[Callable] = None):
         """
@@ -90,7 +146,7 @@ class DeviceManager:
         """
         self.context = pyudev.Context()
         self.monitor = None
-        self.monitor_thread = None
+        self._source_id = 0 # GLib watch on the monitor socket
         self.running = False
         self.on_device_event = on_device_event
         
@@ -100,12 +156,22 @@ class DeviceManager:
         self._device_cache: Dict[str, USBDevice] = {}
         self._syspath_map: Dict[str, str] = {}
 
-    def list_devices(self) -> List[USBDevice]:
-        """Scans current system for USB devices."""
+    def list_devices(self, fresh: bool = False) -> List[USBDevice]:
+        """
+        Scans current system for USB devices.
+        :param fresh: Re-read sysfs instead of trusting values cached since the last udev event
+        """
         devices = []
+        if fresh or not self.running:
+            # Without the monitor nothing invalidates cached sysfs values, and with it
+            # a netlink buffer overflow drops the events that would
+            USBDevice.invalidate_sysfs_cache()
         # Filter for 'usb' subsystem and verify it is a physical device (devtype=usb_device)
         # We skip interfaces (usb_interface) to avoid duplicate entries for the same plug.
-        for device in self.context.list_devices(subsystem='usb', DEVTYPE='usb_device'):
+        # Both matches are added to the libudev enumerator, so interfaces are dropped
+        # inside the scan rather than being wrapped and filtered in Python.
+        enumerator = self.context.list_devices().match_subsystem('usb').match_property('DEVTYPE', 'usb_device')
+        for device in enumerator:
             usb_dev = USBDevice(device)
             devices.append(usb_dev)
             self._device_cache[usb_dev.stable_id] = usb_dev
@@ -113,58 +179,76 @@ class DeviceManager:
         return devices
 
     def start_monitoring(self):
-        """Starts the background udev monitoring thread."""
+        """Starts udev monitoring on the GLib main loop."""
         if self.running:
             return
 
         self.monitor = pyudev.Monitor.from_netlink(self.context)
+        # Installed as a kernel socket filter: non usb_device events never wake us up
         self.monitor.filter_by(subsystem='usb', device_type='usb_device')
+        try:
+            # Room for event storms, e.g. a dock attaching many devices at once
+            self.monitor.set_receive_buffer_size(16 * 1024 * 1024)
+        except EnvironmentError as e:
+            logger.warning(f"Could not enlarge udev receive buffer: {e}")
+        self.monitor.start()
         
+        # The main loop wakes us only when the netlink socket is readable
+        self._source_id = GLib.io_add_watch(
+            self.monitor.fileno(), GLib.PRIORITY_DEFAULT, GLib.IOCondition.IN, self._on_udev_readable
+        )
         self.running = True
-        self.monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
-        self.monitor_thread.start()
         logger.info("Cord ID Monitoring started.")
 
     def stop_monitoring(self):
-        """Stops the monitoring thread."""
+        """Stops monitoring and removes the main loop watch."""
         self.running = False
-        # The thread is daemon, so it will die with the app, 
-        # but clean shutdown is nice if we extend this.
+        if self._source_id:
+            GLib.source_remove(self._source_id)
+            self._source_id = 0
 
-    def _monitor_loop(self):
-        """Background loop processing udev events."""
-        while self.running:
+    def _on_udev_readable(self, fd, condition):
+        """Main loop callback: drains every queued udev event without blocking."""
+        while True:
+            try:
+                device = self.monitor.poll(timeout=0)
+            except Exception as e:
+                logger.error(f"Error reading udev event: {e}")
+                break
+            if device is None:
+                break
             try:
-                # Poll for events. Blocking call with timeout to allow checking self.running
-                device = self.monitor.poll(timeout=1.0)
-                if device:
-                    usb_dev = USBDevice(device)
-                    action = device.action # 'add', 'remove', 'change', 'bind', 'unbind'
-                    
-                    # Handle ID Persistence
-                    if action == 'add':
-                        self._syspath_map[usb_dev.sys_path] = usb_dev.stable_id
-                    elif action == 'remove' or action == 'unbind':
-                        if usb_dev.sys_path in self._syspath_map:
-                            known_id = self._syspath_map[usb_dev.sys_path]
-                            usb_dev._forced_stable_id = known_id
-                            if action == 'remove':
-                                del self._syspath_map[usb_dev.sys_path]
-                    
-                    # Log raw event
-                    logger.info(f"Monitor Event: {action} on {usb_dev.sys_name} | StableID: {usb_dev.stable_id}")
-
-                    # Update Cache
-                    if action == 'add':
-                        self._device_cache[usb_dev.stable_id] = usb_dev
-                    elif action == 'remove':
-                        if usb_dev.stable_id in self._device_cache:
-                            del self._device_cache[usb_dev.stable_id]
-                    
-                    # Notify UI/Listener
-                    if self.on_device_event:
-                        self.on_device_event(action, usb_dev)
-                        
+                self._handle_event(device)
             except Exception as e:
                 logger.error(f"Error in monitor loop: {e}")
-                time.sleep(1) # Prevent tight loop on error
+        return True # Keep watching
+
+    def _handle_event(self, device: pyudev.Device):
+        # Whatever happened, this path's sysfs attributes may have changed
+        USBDevice.invalidate_sysfs_cache(device.sys_path)
+        usb_dev = USBDevice(device)
+        action = device.action # 'add', 'remove', 'change', 'bind', 'unbind'
+        
+        # Handle ID Persistence
+        if action == 'add':
+            self._syspath_map[usb_dev.sys_path] = usb_dev.stable_id
+        elif action == 'remove' or action == 'unbind':
+            if usb_dev.sys_path in self._syspath_map:
+                known_id = self._syspath_map[usb_dev.sys_path]
+                usb_dev.force_stable_id(known_id) # Keep the ID from 'add'; attributes may be gone
+                if action == 'remove':
+                    del self._syspath_map[usb_dev.sys_path]
+        
+        # Log raw event
+        logger.info(f"Monitor Event: {action} on {usb_dev.sys_name} | StableID: {usb_dev.stable_id}")
+
+        # Update Cache
+        if action == 'add':
+            self._device_cache[usb_dev.stable_id] = usb_dev
+        elif action == 'remove':
+            if usb_dev.stable_id in self._device_cache:
+                del self._device_cache[usb_dev.stable_id]
+        
+        # Notify UI/Listener (already on the main thread)
+        if self.on_device_event:
+            self.on_device_event(action, usb_dev)
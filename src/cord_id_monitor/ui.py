@@ -1,14 +1,58 @@
 import gi
-import datetime
+import bisect
+import concurrent.futures
 import json
+import logging
 import os
+import sys
+import time
+from collections import deque
+from typing import Optional
 gi.require_version('Gtk', '4.0')
-from gi.repository import Gtk, GLib, Pango, Gdk
+from gi.repository import Gtk, GLib, Pango, Gdk, Gio, GObject
 
 from .core import DeviceManager, USBDevice
 from .utils import format_speed, get_usb_version_label, UpdateChecker
 from .version import __version__
 
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError: # Optional: stdlib json produces the same files, just slower
+    orjson = None
+
+def _json_dumps(obj) -> bytes:
+    """Compact JSON encoding for the history files."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+def _json_loads(data):
+    # Both raise a ValueError subclass on malformed input
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Events kept in memory and per events.jsonl file before it is rotated
+EVENT_LOG_MAX = 5000
+
+# Event log "event" values
+EVENT_CONNECTED = "Connected"
+EVENT_DISCONNECTED = "Disconnected"
+EVENT_CHANGED = "Changed"
+_EVENT_TYPES = {'add': EVENT_CONNECTED, 'remove': EVENT_DISCONNECTED}
+
+def _intern_event(entry):
+    """
+    Interns an event log entry's strings in place. The same few names, speeds
+    and buses repeat across thousands of entries, so they share one object each.
+    """
+    for key, value in entry.items():
+        if type(value) is str:
+            entry[key] = sys.intern(value)
+    return entry
+
 # --- CSS Styling ---
 # Using GTK4 named colors for theme consistency (Light/Dark mode support)
 CSS_DATA = b"""
@@ -78,56 +122,274 @@ CSS_DATA = b"""
 }
 """
 
+# One provider per process; CSS_DATA is static so it is parsed only once
+_CSS_PROVIDER = None
+
 def apply_css():
-    provider = Gtk.CssProvider()
-    provider.load_from_data(CSS_DATA)
+    global _CSS_PROVIDER
+    if _CSS_PROVIDER is not None:
+        return
+    _CSS_PROVIDER = Gtk.CssProvider()
+    _CSS_PROVIDER.load_from_data(CSS_DATA)
     Gtk.StyleContext.add_provider_for_display(
         Gdk.Display.get_default(), 
-        provider, 
+        _CSS_PROVIDER, 
         Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
     )
 
-class DeviceRow(Gtk.ListBoxRow):
+def _set_label_text(label, text):
+    """set_text() re-measures the label even for identical text; skip it when nothing changed."""
+    if label.get_text() != text:
+        label.set_text(text)
+
+def _make_factory(row_cls):
     """
-    A custom row widget for the device list.
+    Builds a list item factory that recycles row_cls widgets.
+    row_cls must provide bind(item) and unbind().
+    """
+    factory = Gtk.SignalListItemFactory()
+    factory.connect("setup", lambda f, list_item: list_item.set_child(row_cls()))
+    factory.connect("bind", lambda f, list_item: list_item.get_child().bind(list_item.get_item()))
+    factory.connect("unbind", lambda f, list_item: list_item.get_child().unbind())
+    return factory
+
+def _bind_labels(item, pairs, target="label"):
+    """Binds item properties to label text. Returns the bindings so the row can release them."""
+    return [
+        item.bind_property(prop, label, target, GObject.BindingFlags.SYNC_CREATE)
+        for prop, label in pairs
+    ]
+
+# Gtk.Inscription (GTK 4.8+) doesn't measure its text, which keeps fixed-width
+# columns cheap to allocate. Older GTK falls back to a plain Gtk.Label.
+_HAS_INSCRIPTION = hasattr(Gtk, "Inscription")
+_CELL_PROP = "text" if _HAS_INSCRIPTION else "label"
+
+def _make_cell(min_chars, nat_chars, ellipsize=False):
+    """
+    Creates an uneditable, fixed-width text cell.
+    Bind its text through _CELL_PROP.
+    """
+    if _HAS_INSCRIPTION:
+        cell = Gtk.Inscription()
+        cell.set_min_chars(min_chars)
+        cell.set_nat_chars(nat_chars)
+        if ellipsize:
+            cell.set_text_overflow(Gtk.InscriptionOverflow.ELLIPSIZE_END)
+    else:
+        # Character widths are measured once; max_width_chars keeps long text from widening the column
+        cell = Gtk.Label()
+        cell.set_width_chars(min_chars)
+        cell.set_max_width_chars(nat_chars)
+        cell.set_ellipsize(Pango.EllipsizeMode.END)
+        cell.set_halign(Gtk.Align.START)
+    cell.set_xalign(0)
+    return cell
+
+# Connection Log columns as (header, width in characters), shared by the header and LogRow
+_LOG_COLUMNS = (("Time", 12), ("Event", 12), ("Device", 32), ("Speed", 14), ("Bus Path", 18))
+
+class DeviceItem(GObject.Object):
     """
+    Wraps a USBDevice for use in a Gio.ListStore.
+    """
+    title = GObject.Property(type=str, default="")
+    meta = GObject.Property(type=str, default="")
+
     def __init__(self, device: USBDevice):
         super().__init__()
+        self.update(device)
+
+    def update(self, device: USBDevice):
+        """Points the item at a fresh device snapshot, only notifying on changed text."""
         self.device = device
-        
-        box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-        box.set_margin_top(12)
-        box.set_margin_bottom(12)
-        box.set_margin_start(16)
-        box.set_margin_end(16)
-        
-        # Icon
-        icon = Gtk.Image.new_from_icon_name("media-removable")
-        icon.set_pixel_size(32)
-        box.append(icon)
-        
-        # Info Box
-        vbox = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
-        
-        # Title: Vendor Model
-        lbl_title = Gtk.Label(label=device.get_friendly_name())
-        lbl_title.set_halign(Gtk.Align.START)
-        lbl_title.add_css_class("heading")
-        vbox.append(lbl_title)
+        title = device.friendly_name
+        if title != self.title:
+            self.title = title
         
         # Subtitle: Serial | Bus Info
         meta_text = f"Bus {device.bus_num} Port {device.sys_name}"
         if device.serial:
             meta_text += f" | S/N: {device.serial}"
+        if meta_text != self.meta:
+            self.meta = meta_text
+
+class LogEntry(GObject.Object):
+    """
+    A single Connection Log event, wrapped for use in a Gio.ListStore.
+    seq orders events; time alone wraps around every day.
+    """
+    seq = GObject.Property(type=int, default=0)
+    time = GObject.Property(type=str, default="")
+    event = GObject.Property(type=str, default="")
+    device_name = GObject.Property(type=str, default="")
+    speed = GObject.Property(type=str, default="")
+    bus = GObject.Property(type=str, default="")
+    version = GObject.Property(type=str, default="")
+
+class RegistryEntry(GObject.Object):
+    """
+    A Device Registry record, wrapped for use in a Gio.ListStore.
+    """
+    stable_id = GObject.Property(type=str, default="")
+    name = GObject.Property(type=str, default="")
+    speeds = GObject.Property(type=str, default="")
+    last_seen = GObject.Property(type=str, default="")
+
+    def __init__(self, stable_id, data):
+        super().__init__(stable_id=stable_id)
+        self.update(data)
+
+    def update(self, data):
+        """Refreshes from a registry dict, only notifying on changed text."""
+        if data['name'] != self.name:
+            self.name = data['name']
+        if data['last_seen'] != self.last_seen:
+            self.last_seen = data['last_seen']
+        
+        # speeds is kept in ascending order by MainWindow; show fastest first
+        speeds_fmt = [format_speed(str(s))[0] for s in reversed(data['speeds'])]
+        speeds = ', '.join(speeds_fmt)
+        if speeds != self.speeds:
+            self.speeds = speeds
+
+class DeviceRow(Gtk.Grid):
+    """
+    A custom row widget for the device list.
+    """
+    def __init__(self):
+        super().__init__()
+        self.set_column_spacing(12)
+        self.set_row_spacing(4)
+        self.set_margin_top(12)
+        self.set_margin_bottom(12)
+        self.set_margin_start(16)
+        self.set_margin_end(16)
+        self._bindings = []
+        
+        # Icon (spans both text lines)
+        icon = Gtk.Image.new_from_icon_name("media-removable")
+        icon.set_pixel_size(32)
+        self.attach(icon, 0, 0, 1, 2)
         
-        lbl_meta = Gtk.Label(label=meta_text)
-        lbl_meta.set_halign(Gtk.Align.START)
-        lbl_meta.add_css_class("caption")
-        lbl_meta.set_opacity(0.7)
-        vbox.append(lbl_meta)
+        # Title: Vendor Model
+        self.lbl_title = Gtk.Label()
+        self.lbl_title.set_halign(Gtk.Align.START)
+        self.lbl_title.add_css_class("heading")
+        self.attach(self.lbl_title, 1, 0, 1, 1)
         
-        box.append(vbox)
-        self.set_child(box)
+        # Subtitle: Serial | Bus Info
+        self.lbl_meta = Gtk.Label()
+        self.lbl_meta.set_halign(Gtk.Align.START)
+        self.lbl_meta.add_css_class("caption")
+        self.lbl_meta.set_opacity(0.7)
+        self.attach(self.lbl_meta, 1, 1, 1, 1)
+
+    def bind(self, item: DeviceItem):
+        self._bindings = _bind_labels(item, [("title", self.lbl_title), ("meta", self.lbl_meta)])
+
+    def unbind(self):
+        for binding in self._bindings:
+            binding.unbind()
+        self._bindings = []
+
+class LogRow(Gtk.Grid):
+    """
+    A recyclable row widget for the Connection Log.
+    """
+    def __init__(self):
+        super().__init__()
+        self.set_column_spacing(10)
+        self.set_margin_top(8)
+        self.set_margin_bottom(8)
+        self.set_margin_start(10)
+        self._bindings = []
+        
+        self.lbl_time, self.lbl_evt, self.lbl_dev, self.lbl_spd, self.lbl_bus = [
+            self._add_column(column, width_chars)
+            for column, (_, width_chars) in enumerate(_LOG_COLUMNS)
+        ]
+
+    def _add_column(self, column, width_chars):
+        # Fixed width (min == natural) so rows line up with the header
+        cell = _make_cell(width_chars, width_chars, ellipsize=True)
+        self.attach(cell, column, 0, 1, 1)
+        return cell
+
+    def bind(self, entry: LogEntry):
+        self._bindings = _bind_labels(entry, [
+            ("time", self.lbl_time),
+            ("event", self.lbl_evt),
+            ("device_name", self.lbl_dev),
+            ("speed", self.lbl_spd),
+            ("bus", self.lbl_bus),
+        ], target=_CELL_PROP)
+        self.lbl_dev.set_tooltip_text(entry.device_name)
+        if entry.event == EVENT_CONNECTED:
+            self.lbl_evt.add_css_class("success-status")
+        elif entry.event == EVENT_DISCONNECTED:
+            self.lbl_evt.add_css_class("error-status")
+
+    def unbind(self):
+        for binding in self._bindings:
+            binding.unbind()
+        self._bindings = []
+        self.lbl_evt.remove_css_class("success-status")
+        self.lbl_evt.remove_css_class("error-status")
+
+class RegistryRow(Gtk.Grid):
+    """
+    A recyclable card widget for the Device Registry.
+    """
+    def __init__(self):
+        super().__init__()
+        self.set_column_spacing(10)
+        self.set_row_spacing(4)
+        self.add_css_class("card")
+        self.set_margin_top(8)
+        self.set_margin_bottom(8)
+        self.set_margin_start(16)
+        self.set_margin_end(16)
+        self._bindings = []
+        
+        # Header: Name + ID on the first grid row
+        self.lbl_name = Gtk.Label()
+        self.lbl_name.set_halign(Gtk.Align.START)
+        self.lbl_name.add_css_class("heading")
+        self.attach(self.lbl_name, 0, 0, 1, 1)
+        
+        self.lbl_id = _make_cell(12, 40, ellipsize=True)
+        self.lbl_id.set_opacity(0.5)
+        self.attach(self.lbl_id, 1, 0, 1, 1)
+        
+        self.lbl_speeds = Gtk.Label()
+        self.lbl_speeds.set_halign(Gtk.Align.START)
+        self.attach(self.lbl_speeds, 0, 1, 2, 1)
+        
+        self.lbl_seen = _make_cell(20, 20)
+        self.lbl_seen.set_opacity(0.7)
+        self.attach(self.lbl_seen, 0, 2, 2, 1)
+
+    def bind(self, entry: RegistryEntry):
+        flags = GObject.BindingFlags.SYNC_CREATE
+        self._bindings = [
+            entry.bind_property("name", self.lbl_name, "label", flags),
+            entry.bind_property("stable_id", self.lbl_id, _CELL_PROP, flags,
+                                lambda binding, value: f"ID: {value}"),
+            entry.bind_property("speeds", self.lbl_speeds, "label", flags,
+                                lambda binding, value: f"Observed Speeds: {value}"),
+            entry.bind_property("last_seen", self.lbl_seen, _CELL_PROP, flags,
+                                lambda binding, value: f"Last Seen: {value}"),
+        ]
+
+    def unbind(self):
+        for binding in self._bindings:
+            binding.unbind()
+        self._bindings = []
+
+# Chart tiers in ascending Mbps, matching the node keys in USBVersionChart
+_SPEED_TIERS = (480, 5000, 10000, 20000, 40000, 80000)
+_SPEED_KEYS = tuple(str(tier) for tier in _SPEED_TIERS)
 
 class USBVersionChart(Gtk.Box):
     """
@@ -142,6 +404,7 @@ class USBVersionChart(Gtk.Box):
         
         # Nodes
         self.nodes = {}
+        self._last_active = None
         # We now use speed-based categories for the chart nodes as they are more descriptive
         # than the protocol version numbers.
         tiers = [
@@ -168,29 +431,21 @@ class USBVersionChart(Gtk.Box):
             self.append(lbl)
             self.nodes[key] = lbl
 
-    def set_active_speed(self, speed_mbps_str: str):
-        # Reset all
-        for node in self.nodes.values():
-            node.remove_css_class("active")
-            
-        if not speed_mbps_str or speed_mbps_str == "N/A":
+    def set_active_speed(self, speed_mbps: Optional[int]):
+        key = None
+        if speed_mbps is not None:
+            # Highlight the exact tier, or the nearest lower one for non-standard speeds
+            idx = bisect.bisect_right(_SPEED_TIERS, speed_mbps) - 1
+            key = _SPEED_KEYS[max(idx, 0)]
+        
+        # Skip CSS churn when the highlighted node doesn't change
+        if key == self._last_active:
             return
-
-        # Direct match for standard speeds
-        if speed_mbps_str in self.nodes:
-            self.nodes[speed_mbps_str].add_css_class("active")
-        else:
-            # Fallback for non-standard speeds (highlight nearest lower)
-            try:
-                val = int(speed_mbps_str)
-                if val < 5000: self.nodes["480"].add_css_class("active")
-                elif val < 10000: self.nodes["5000"].add_css_class("active")
-                elif val < 20000: self.nodes["10000"].add_css_class("active")
-                elif val < 40000: self.nodes["20000"].add_css_class("active")
-                elif val < 80000: self.nodes["40000"].add_css_class("active")
-                else: self.nodes["80000"].add_css_class("active")
-            except:
-                pass
+        if self._last_active is not None:
+            self.nodes[self._last_active].remove_css_class("active")
+        if key is not None:
+            self.nodes[key].add_css_class("active")
+        self._last_active = key
 
 
 class MonitoringPage(Gtk.Box):
@@ -201,11 +456,12 @@ class MonitoringPage(Gtk.Box):
         super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=0)
         self.history_cache = history_cache
         self.save_callback = save_callback
-        # Apply CSS for this window context
-        apply_css()
         
         self.stop_callback = stop_callback
         self.current_target_id = None
+        # Last rendered state, so repeated updates don't restyle unchanged widgets
+        self._last_connected = None
+        self._last_speed = None
         
         # --- Top Bar (Status) ---
         top_bar = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
@@ -299,7 +555,7 @@ class MonitoringPage(Gtk.Box):
             lbl_key = Gtk.Label(label=f"{label}:")
             lbl_key.set_halign(Gtk.Align.START)
             lbl_key.set_xalign(0)
-            lbl_key.set_size_request(140, -1)
+            lbl_key.set_width_chars(16)
             
             lbl_val = Gtk.Label(label="--")
             lbl_val.set_halign(Gtk.Align.START)
@@ -319,74 +575,83 @@ class MonitoringPage(Gtk.Box):
 
     def set_target(self, device: USBDevice):
         self.current_target_id = device.stable_id
+        # Force a full redraw for the new target
+        self._last_connected = None
+        self._last_speed = None
         # Set static info immediately
-        self.lbl_dev_name.set_text(device.get_friendly_name())
+        self.lbl_dev_name.set_text(device.friendly_name)
         self.lbl_dev_id.set_text(f"{device.vendor} ({device.vid}:{device.pid})")
         
         self.update_view(device, connected=True)
 
     def update_view(self, device: USBDevice, connected: bool):
+        # Status, speed, health and chart only change with the link state or the speed.
+        # The detail rows are always refreshed: a re-enumeration at the same speed
+        # brings a new address, and _set_label_text() skips unchanged text anyway.
+        state_changed = connected != self._last_connected
+        speed_changed = device.speed != self._last_speed
+        self._last_connected = connected
+        self._last_speed = device.speed
+        
         if connected:
-            self.lbl_status.set_text("Connected")
-            self.lbl_status.remove_css_class("error-status")
-            self.lbl_status.add_css_class("success-status")
+            if state_changed:
+                self.lbl_status.set_text("Connected")
+                self.lbl_status.remove_css_class("error-status")
+                self.lbl_status.add_css_class("success-status")
+                self.lbl_speed_val.set_opacity(1.0)
             
-            # Formatted Speed
-            speed_str, speed_label = format_speed(device.speed)
-            self.lbl_speed_val.set_text(speed_str)
-            self.lbl_speed_sub.set_text(speed_label if speed_label else "Negotiated Link Speed")
+            if state_changed or speed_changed:
+                # Formatted Speed
+                speed_str, speed_label = format_speed(device.speed)
+                _set_label_text(self.lbl_speed_val, speed_str)
+                _set_label_text(self.lbl_speed_sub, speed_label if speed_label else "Negotiated Link Speed")
             
-            # Link Health Check
-            # Logic: Update Max Known Speed, then compare current vs Max.
-            is_downgraded = False
-            known_max = 0
-            current_speed = 0
+                # Link Health Check
+                # Logic: Update Max Known Speed, then compare current vs Max.
+                is_downgraded = False
+                known_max = 0
+                current_speed = 0
             
-            try:
-                current_speed = int(device.speed)
-                
-                # Update History
-                if device.stable_id not in self.history_cache:
-                    self.history_cache[device.stable_id] = current_speed
-                    self.save_callback() # Save new entry
-                else:
-                    if current_speed > self.history_cache[device.stable_id]:
-                        self.history_cache[device.stable_id] = current_speed
-                        self.save_callback() # Save improved speed
+                # Non-numeric speeds (e.g. "N/A", "1.5") have no history to compare against
+                if device.speed_int is not None:
+                    current_speed = device.speed_int
                 
-                known_max = self.history_cache[device.stable_id]
+                    # Update History: only save when the stored max actually changes
+                    # (a new device, or a known one at a faster speed)
+                    prev = self.history_cache.get(device.stable_id, -1)
+                    known_max = max(prev, current_speed)
+                    if known_max != prev:
+                        self.history_cache[device.stable_id] = known_max
+                        self.save_callback()
                 
-                # Downgrade Threshold: If current speed is less than what we've seen before
-                if current_speed < known_max:
-                    is_downgraded = True
-                    max_speed_str, max_speed_moniker = format_speed(str(known_max))
-                    history_text = f"We have previously observed this device on your system connect at {max_speed_str} ({max_speed_moniker})."
+                    # Downgrade Threshold: If current speed is less than what we've seen before
+                    if current_speed < known_max:
+                        is_downgraded = True
+                        max_speed_str, max_speed_moniker = format_speed(str(known_max))
+                        history_text = f"We have previously observed this device on your system connect at {max_speed_str} ({max_speed_moniker})."
                     
-                    if current_speed <= 480 and known_max >= 5000:
-                        downgrade_msg = f"Running at legacy USB 2.0 speeds. {history_text}"
-                    else:
-                        downgrade_msg = f"Running at {speed_str} but {history_text}"
-
-            except Exception as e:
-                print(f"Error in health check: {e}")
+                        if current_speed <= 480 and known_max >= 5000:
+                            downgrade_msg = f"Running at legacy USB 2.0 speeds. {history_text}"
+                        else:
+                            downgrade_msg = f"Running at {speed_str} but {history_text}"
             
-            if is_downgraded:
-                self.lbl_health.set_text("⚠️ Link Downgraded")
-                self.lbl_health.set_tooltip_text(downgrade_msg)
-                self.health_revealer.set_reveal_child(True)
-            else:
-                self.health_revealer.set_reveal_child(False)
+                if is_downgraded:
+                    self.lbl_health.set_text("⚠️ Link Downgraded")
+                    self.lbl_health.set_tooltip_text(downgrade_msg)
+                    self.health_revealer.set_reveal_child(True)
+                else:
+                    self.health_revealer.set_reveal_child(False)
             
-            # Chart - Now based on speed
-            self.chart.set_active_speed(device.speed)
+                # Chart - Now based on speed
+                self.chart.set_active_speed(device.speed_int)
             
             # Details
-            self.rows['version_row'].set_text(get_usb_version_label(device.version))
-            self.rows['serial_row'].set_text(device.serial if device.serial else "N/A")
-            self.rows['bus_row'].set_text(f"Bus {device.bus_num} | Addr {device.dev_num} | Path {device.sys_name}")
-            self.rows['power_row'].set_text(device.max_power)
+            _set_label_text(self.rows['version_row'], get_usb_version_label(device.version))
+            _set_label_text(self.rows['serial_row'], device.serial if device.serial else "N/A")
+            _set_label_text(self.rows['bus_row'], f"Bus {device.bus_num} | Addr {device.dev_num} | Path {device.sys_name}")
+            _set_label_text(self.rows['power_row'], device.max_power)
             
-        else:
+        elif state_changed:
             self.lbl_status.set_text("Disconnected - Waiting...")
             self.lbl_status.remove_css_class("success-status")
             self.lbl_status.add_css_class("error-status")
@@ -421,36 +686,50 @@ class HistoryWindow(Gtk.Window):
         vbox.append(stack)
         
         # --- Tab 1: Connection Log ---
-        self.listbox_log = Gtk.ListBox()
-        self.listbox_log.set_selection_mode(Gtk.SelectionMode.NONE)
-        self.listbox_log.add_css_class("card")
+        # Stored in arrival order; the sort model shows newest at top
+        self.log_store = Gio.ListStore.new(LogEntry)
+        sorter = Gtk.NumericSorter.new(Gtk.PropertyExpression.new(LogEntry.__gtype__, None, "seq"))
+        sorter.set_sort_order(Gtk.SortType.DESCENDING)
+        self.listview_log = Gtk.ListView(
+            model=Gtk.NoSelection.new(Gtk.SortListModel.new(self.log_store, sorter)),
+            factory=_make_factory(LogRow)
+        )
+        self.listview_log.add_css_class("card")
         
         self.log_view = self._create_log_view()
         stack.add_titled(self.log_view, "log", "Connection Log")
         
         # --- Tab 2: Device Registry ---
-        self.listbox_registry = Gtk.ListBox()
-        self.listbox_registry.set_selection_mode(Gtk.SelectionMode.NONE)
+        self.registry_store = Gio.ListStore.new(RegistryEntry)
+        self._registry_items = {} # stable_id -> RegistryEntry shown in registry_store
+        self.listview_registry = Gtk.ListView(
+            model=Gtk.NoSelection.new(self.registry_store),
+            factory=_make_factory(RegistryRow)
+        )
         
         self.registry_view = self._create_registry_view()
         stack.add_titled(self.registry_view, "registry", "Device Registry")
 
     def _create_log_view(self):
         # Header Row
-        header_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
+        header_box = Gtk.Grid()
+        header_box.set_column_spacing(10)
         header_box.set_margin_start(10)
         header_box.set_margin_end(10)
         header_box.set_margin_top(10)
         header_box.set_margin_bottom(5)
         
-        cols = [("Time", 100), ("Event", 100), ("Device", 250), ("Speed", 120), ("Bus Path", 150)]
-        for name, width in cols:
+        for column, (name, width_chars) in enumerate(_LOG_COLUMNS):
+            # Characters are wider in the bold heading font, so the width comes from an
+            # empty, un-styled cell made like LogRow's; the heading is overlaid on it.
+            cell = Gtk.Overlay()
+            cell.set_child(_make_cell(width_chars, width_chars, ellipsize=True))
             lbl = Gtk.Label(label=name)
-            lbl.set_size_request(width, -1)
-            lbl.set_halign(Gtk.Align.START)
+            lbl.set_ellipsize(Pango.EllipsizeMode.END)
             lbl.set_xalign(0)
             lbl.add_css_class("heading")
-            header_box.append(lbl)
+            cell.add_overlay(lbl)
+            header_box.attach(cell, column, 0, 1, 1)
         
         container = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
         container.append(header_box)
@@ -458,116 +737,43 @@ class HistoryWindow(Gtk.Window):
         
         scrolled = Gtk.ScrolledWindow()
         scrolled.set_vexpand(True)
-        scrolled.set_child(self.listbox_log)
+        scrolled.set_child(self.listview_log)
         container.append(scrolled)
         
-        # Initial Population (Newest at top)
-        for entry in reversed(self.event_log):
-            self.add_event_to_list(entry)
+        # Initial Population; the ListView only builds widgets for visible rows
+        self.log_store.splice(0, 0, [LogEntry(seq=seq, **entry) for seq, entry in enumerate(self.event_log)])
             
         return container
 
-    def add_event_to_list(self, entry, at_top=False):
-        row_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
-        row_box.set_margin_top(8)
-        row_box.set_margin_bottom(8)
-        row_box.set_margin_start(10)
-        
-        # Timestamp
-        lbl_time = Gtk.Label(label=entry['time'])
-        lbl_time.set_size_request(100, -1)
-        lbl_time.set_halign(Gtk.Align.START)
-        lbl_time.set_xalign(0)
-        row_box.append(lbl_time)
-        
-        # Event
-        lbl_evt = Gtk.Label(label=entry['event'])
-        lbl_evt.set_size_request(100, -1)
-        lbl_evt.set_halign(Gtk.Align.START)
-        lbl_evt.set_xalign(0)
-        if entry['event'] == 'Connected':
-            lbl_evt.add_css_class("success-status")
-        elif entry['event'] == 'Disconnected':
-            lbl_evt.add_css_class("error-status")
-        row_box.append(lbl_evt)
-        
-        # Device
-        lbl_dev = Gtk.Label(label=entry['device_name'])
-        lbl_dev.set_size_request(250, -1)
-        lbl_dev.set_halign(Gtk.Align.START)
-        lbl_dev.set_xalign(0)
-        lbl_dev.set_ellipsize(Pango.EllipsizeMode.END)
-        lbl_dev.set_tooltip_text(entry['device_name'])
-        row_box.append(lbl_dev)
-        
-        # Speed
-        lbl_spd = Gtk.Label(label=entry['speed'])
-        lbl_spd.set_size_request(120, -1)
-        lbl_spd.set_halign(Gtk.Align.START)
-        lbl_spd.set_xalign(0)
-        row_box.append(lbl_spd)
-        
-        # Bus
-        lbl_bus = Gtk.Label(label=entry['bus'])
-        lbl_bus.set_size_request(150, -1)
-        lbl_bus.set_halign(Gtk.Align.START)
-        lbl_bus.set_xalign(0)
-        row_box.append(lbl_bus)
-        
-        if at_top:
-            self.listbox_log.prepend(row_box)
-        else:
-            self.listbox_log.append(row_box)
+    def add_event(self, entry):
+        # The sort model places it at the top
+        self.log_store.append(LogEntry(seq=self.log_store.get_n_items(), **entry))
 
     def refresh_registry(self):
-        # Clear
-        child = self.listbox_registry.get_first_child()
-        while child:
-            self.listbox_registry.remove(child)
-            child = self.listbox_registry.get_first_child()
-            
-        # Re-populate
+        # Diff against the shown entries so unchanged rows are left alone
+        for old_id in self._registry_items.keys() - self.device_registry.keys():
+            found, pos = self.registry_store.find(self._registry_items.pop(old_id))
+            if found:
+                self.registry_store.remove(pos)
+        
+        added = []
         for stable_id, data in self.device_registry.items():
-            self._add_registry_row(stable_id, data)
-
-    def _add_registry_row(self, stable_id, data):
-        row = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
-        row.add_css_class("card")
-        row.set_margin_top(8)
-        row.set_margin_bottom(8)
-        row.set_margin_start(16)
-        row.set_margin_end(16)
-        
-        header = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
-        lbl_name = Gtk.Label(label=data['name'])
-        lbl_name.set_markup(f"<b>{data['name']}</b>")
-        header.append(lbl_name)
-        
-        lbl_id = Gtk.Label(label=f"ID: {stable_id}")
-        lbl_id.set_opacity(0.5)
-        header.append(lbl_id)
-        row.append(header)
-        
-        speeds_fmt = []
-        for s in sorted(list(data['speeds']), reverse=True):
-            s_str, _ = format_speed(str(s))
-            speeds_fmt.append(s_str)
-        
-        lbl_speeds = Gtk.Label(label=f"Observed Speeds: {', '.join(speeds_fmt)}")
-        lbl_speeds.set_halign(Gtk.Align.START)
-        row.append(lbl_speeds)
-        
-        lbl_seen = Gtk.Label(label=f"Last Seen: {data['last_seen']}")
-        lbl_seen.set_halign(Gtk.Align.START)
-        lbl_seen.set_opacity(0.7)
-        row.append(lbl_seen)
-        
-        self.listbox_registry.append(row)
+            entry = self._registry_items.get(stable_id)
+            if entry is None:
+                entry = RegistryEntry(stable_id, data)
+                self._registry_items[stable_id] = entry
+                added.append(entry)
+            else:
+                entry.update(data)
+        
+        # One items-changed signal for all new rows
+        if added:
+            self.registry_store.splice(self.registry_store.get_n_items(), 0, added)
 
     def _create_registry_view(self):
         scrolled = Gtk.ScrolledWindow()
         scrolled.set_vexpand(True)
-        scrolled.set_child(self.listbox_registry)
+        scrolled.set_child(self.listview_registry)
         self.refresh_registry()
         return scrolled
 
@@ -580,12 +786,23 @@ class MainWindow(Gtk.ApplicationWindow):
         # Paths
         self.config_dir = os.path.expanduser("~/.config/cord_id_monitor")
         self.history_file = os.path.join(self.config_dir, "history.json")
+        self.events_file = os.path.join(self.config_dir, "events.jsonl")
         
         # Data Structures
         self.device_history = {} # Capability Cache: stable_id -> max_speed_mbps (int)
-        self.event_log = [] # List[dict]
-        self.device_registry = {} # stable_id -> {name, speeds: set, last_seen}
+        self.event_log = deque(maxlen=EVENT_LOG_MAX) # Newest last
+        self._events_on_disk = 0 # Lines in events_file since the last rotation
+        self._events_fp = None # Append handle for events_file, only touched on the writer thread
+        self._legacy_log = None # history.json's old event_log, kept there until events_file holds it
+        self.device_registry = {} # stable_id -> {name, speeds: sorted list, last_seen}
         self.active_history_window = None
+        self._save_pending = 0 # GLib source id of the scheduled save, 0 if none
+        self._save_first = 0.0 # time.monotonic() of the oldest change the pending save covers
+        self._last_sec = 0 # Second last formatted by _now_hms()
+        self._last_hms = ''
+        self._save_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1) # Serializes writes
+        self._pending_events = [] # (action, USBDevice) received since the last _flush_events()
+        self._coalesce_source = None # GLib source id of the scheduled _flush_events(), None if none
         
         # Load persisted data
         self.load_history()
@@ -593,7 +810,7 @@ class MainWindow(Gtk.ApplicationWindow):
         # Apply global CSS
         apply_css()
         
-        self.device_manager = DeviceManager(on_device_event=self.on_device_event_threadsafe)
+        self.device_manager = DeviceManager(on_device_event=self.handle_device_event)
         
         # Main Layout
         self.stack = Gtk.Stack()
@@ -622,6 +839,19 @@ class MainWindow(Gtk.ApplicationWindow):
         self.split_grid.set_margin_end(20)
         self.split_grid.set_column_homogeneous(False)
         
+        # Both lists show the same connected devices: the right one all of them,
+        # the left one only those in device_history
+        self.device_store = Gio.ListStore.new(DeviceItem)
+        # Keyed by sys_path, not stable_id: identical devices can share a serial number,
+        # and each still needs its own row. stable_id stays the key for history/registry.
+        self._device_items = {} # sys_path -> DeviceItem in device_store
+        self._history_ids = set(self.device_history) # device_history keys the left list's filter last saw
+        self.history_filter = Gtk.CustomFilter.new(self._is_known_device)
+        self.known_devices = Gtk.FilterListModel(model=self.device_store, filter=self.history_filter)
+        # Factories hold no per-list state, so one serves both lists. Each list only
+        # builds DeviceRows for its visible items; a device never gets a row per list up front.
+        self.device_factory = _make_factory(DeviceRow)
+        
         # LEFT: Previously Monitored (1 unit wide)
         self.box_left = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=5)
         self.box_left.set_hexpand(True)
@@ -631,14 +861,23 @@ class MainWindow(Gtk.ApplicationWindow):
         lbl_left.set_halign(Gtk.Align.START)
         self.box_left.append(lbl_left)
         
+        self.sel_left = Gtk.SingleSelection(model=self.known_devices, autoselect=False, can_unselect=True)
+        self.sel_left.connect("notify::selected", self.on_left_selected)
+        self.list_left = Gtk.ListView(model=self.sel_left, factory=self.device_factory)
+        
         self.scroll_left = Gtk.ScrolledWindow()
         self.scroll_left.set_vexpand(True)
-        self.scroll_left.add_css_class("card") # nice border
-        self.list_left = Gtk.ListBox()
-        self.list_left.set_selection_mode(Gtk.SelectionMode.SINGLE)
-        self.list_left.connect("row-selected", self.on_left_selected)
         self.scroll_left.set_child(self.list_left)
-        self.box_left.append(self.scroll_left)
+        
+        # Lists can't show placeholders themselves, so swap in a label when empty
+        self.lbl_left_empty = Gtk.Label()
+        self.lbl_left_empty.set_valign(Gtk.Align.START)
+        self.lbl_left_empty.set_margin_top(20)
+        self.stack_left = Gtk.Stack()
+        self.stack_left.add_css_class("card") # nice border
+        self.stack_left.add_named(self.scroll_left, "list")
+        self.stack_left.add_named(self.lbl_left_empty, "empty")
+        self.box_left.append(self.stack_left)
         
         # Attach to grid: col=0, row=0, width=1, height=1
         self.split_grid.attach(self.box_left, 0, 0, 1, 1)
@@ -652,14 +891,22 @@ class MainWindow(Gtk.ApplicationWindow):
         lbl_right.set_halign(Gtk.Align.START)
         self.box_right.append(lbl_right)
         
+        self.sel_right = Gtk.SingleSelection(model=self.device_store, autoselect=False, can_unselect=True)
+        self.sel_right.connect("notify::selected", self.on_right_selected)
+        self.list_right = Gtk.ListView(model=self.sel_right, factory=self.device_factory)
+        
         self.scroll_right = Gtk.ScrolledWindow()
         self.scroll_right.set_vexpand(True)
-        self.scroll_right.add_css_class("card")
-        self.list_right = Gtk.ListBox()
-        self.list_right.set_selection_mode(Gtk.SelectionMode.SINGLE)
-        self.list_right.connect("row-selected", self.on_right_selected)
         self.scroll_right.set_child(self.list_right)
-        self.box_right.append(self.scroll_right)
+        
+        self.lbl_right_empty = Gtk.Label()
+        self.lbl_right_empty.set_valign(Gtk.Align.START)
+        self.lbl_right_empty.set_margin_top(20)
+        self.stack_right = Gtk.Stack()
+        self.stack_right.add_css_class("card")
+        self.stack_right.add_named(self.scroll_right, "list")
+        self.stack_right.add_named(self.lbl_right_empty, "empty")
+        self.box_right.append(self.stack_right)
         
         # Attach to grid: col=1, row=0, width=2, height=1
         self.split_grid.attach(self.box_right, 1, 0, 2, 1)
@@ -689,7 +936,7 @@ class MainWindow(Gtk.ApplicationWindow):
         self.page_monitoring = MonitoringPage(
             stop_callback=self.stop_monitoring, 
             history_cache=self.device_history,
-            save_callback=self.save_history
+            save_callback=self.schedule_save
         )
         self.stack.add_named(self.page_monitoring, "monitoring")
         
@@ -719,6 +966,9 @@ class MainWindow(Gtk.ApplicationWindow):
         overlay.add_overlay(self.update_bar)
         self.set_child(overlay)
 
+        # Don't lose a pending save when the window closes
+        self.connect("close-request", self.on_close_request)
+
         # Start
         self.refresh_devices()
         self.device_manager.start_monitoring()
@@ -727,6 +977,7 @@ class MainWindow(Gtk.ApplicationWindow):
         UpdateChecker.check_for_updates(__version__, self._on_update_found)
 
     def _on_update_found(self, version, url):
+        # Called on the UpdateChecker thread
         def _ui_update():
             self.btn_upd.set_label(f"Download v{version}")
             self.btn_upd.set_uri(url)
@@ -734,51 +985,181 @@ class MainWindow(Gtk.ApplicationWindow):
         GLib.idle_add(_ui_update)
 
     def load_history(self):
-        if not os.path.exists(self.history_file):
+        legacy_log = None
+        if os.path.exists(self.history_file):
+            try:
+                with open(self.history_file, 'rb') as f:
+                    data = _json_loads(f.read())
+                    
+                self.device_history = data.get('device_history', {})
+                # Older versions kept the event log inside history.json
+                legacy_log = data.get('event_log')
+                
+                # speeds is persisted as a sorted list and used as-is. Older files stored
+                # it in set order; sort() is a single pass otherwise.
+                self.device_registry = data.get('device_registry', {})
+                for entry in self.device_registry.values():
+                    entry['speeds'].sort()
+                    
+                print(f"Loaded history from {self.history_file}")
+            except Exception as e:
+                print(f"Failed to load history: {e}")
+        
+        # The rotated backup holds the events just before the current file. Read it on
+        # its own: right after a rotation the current file doesn't exist until the next event.
+        backup, current = [], []
+        if os.path.exists(self.events_file + '.1'):
+            backup = self._read_events(self.events_file + '.1')
+        if os.path.exists(self.events_file):
+            current = self._read_events(self.events_file)
+        
+        if legacy_log:
+            # history.json only still has event_log when migrating it hasn't finished.
+            # Events appended since then come after it, unless the process died between
+            # the two writes of _migrate_events(): then events_file already starts with it.
+            legacy = [_intern_event(entry) for entry in legacy_log]
+            if current[:len(legacy)] != legacy:
+                current = legacy + current
+            self._legacy_log = legacy_log
+            events_payload = b''.join(_json_dumps(entry) + b'\n' for entry in current)
+            self._save_executor.submit(self._migrate_events, events_payload, self._encode_history())
+        self._events_on_disk = len(current)
+        self.event_log = deque(backup + current, maxlen=EVENT_LOG_MAX)
+
+    def _read_events(self, path):
+        events = []
+        try:
+            with open(path, 'rb') as f:
+                for line in f:
+                    try:
+                        events.append(_intern_event(_json_loads(line)))
+                    except ValueError:
+                        pass # Skip a line torn by a crash mid-append
+        except OSError as e:
+            print(f"Failed to load event log: {e}")
+        return events
+
+    def _encode_history(self, event_log=None):
+        # Everything in the registry is already JSON-native, so it is encoded as-is.
+        # The event log is not part of this file, see _append_event(), except for
+        # a legacy one that hasn't been migrated yet.
+        data = {
+            'device_history': self.device_history,
+            'device_registry': self.device_registry
+        }
+        if event_log is not None:
+            data['event_log'] = event_log
+        return _json_dumps(data)
+
+    def save_history(self):
+        # Encoding happens here, on the main thread, so the writer never sees live state
+        try:
+            payload = self._encode_history(self._legacy_log)
+        except Exception as e:
+            print(f"Failed to save history: {e}")
             return
-            
+        self._save_executor.submit(self._write_atomic, self.history_file, payload)
+
+    def _append_event(self, entry):
+        """Appends one event to events.jsonl. Entries are never mutated, so no copy is needed."""
+        self._save_executor.submit(self._write_event_line, _json_dumps(entry) + b'\n')
+        self._events_on_disk += 1
+        if self._events_on_disk >= EVENT_LOG_MAX:
+            # Queued after the append, so the rotated file is complete
+            self._save_executor.submit(self._rotate_events, self.events_file)
+            self._events_on_disk = 0
+
+    def _write_atomic(self, path, payload, label="history"):
+        """Runs on the writer thread. Writes to a temp file and renames it into place."""
         try:
-            with open(self.history_file, 'r') as f:
-                data = json.load(f)
-                
-            self.device_history = data.get('device_history', {})
-            self.event_log = data.get('event_log', [])
-            
-            # device_registry needs manual deserialization (list -> set)
-            raw_registry = data.get('device_registry', {})
-            for stable_id, entry in raw_registry.items():
-                entry['speeds'] = set(entry['speeds']) # Convert list back to set
-                self.device_registry[stable_id] = entry
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+                # Data must be on disk before the rename, or a power loss can leave an empty file
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
                 
-            print(f"Loaded history from {self.history_file}")
+            print(f"Saved {label} to {path}")
+            return True
         except Exception as e:
-            print(f"Failed to load history: {e}")
+            print(f"Failed to save {label}: {e}")
+            return False
 
-    def save_history(self):
+    def _migrate_events(self, events_payload, history_payload):
+        """
+        Runs on the writer thread, before any append. Replaces events_file with the
+        migrated log, then drops event_log from history.json right away.
+        """
+        if (self._write_atomic(self.events_file, events_payload, "event log")
+                and self._write_atomic(self.history_file, history_payload)):
+            GLib.idle_add(self._on_events_migrated)
+
+    def _on_events_migrated(self):
+        # Later saves can leave event_log out as well
+        self._legacy_log = None
+        return False # One-shot
+
+    def _write_event_line(self, line):
+        """Runs on the writer thread. The file stays open, so each event is one write."""
         try:
-            if not os.path.exists(self.config_dir):
+            if self._events_fp is None:
                 os.makedirs(self.config_dir, exist_ok=True)
-                
-            # Prepare registry for JSON (set -> list)
-            serializable_registry = {}
-            for stable_id, entry in self.device_registry.items():
-                # Copy entry to avoid modifying the running state
-                entry_copy = entry.copy()
-                entry_copy['speeds'] = list(entry['speeds'])
-                serializable_registry[stable_id] = entry_copy
-            
-            data = {
-                'device_history': self.device_history,
-                'event_log': self.event_log,
-                'device_registry': serializable_registry
-            }
-            
-            with open(self.history_file, 'w') as f:
-                json.dump(data, f, indent=2)
-                
-            print(f"Saved history to {self.history_file}")
-        except Exception as e:
-            print(f"Failed to save history: {e}")
+                self._events_fp = open(self.events_file, 'ab')
+            self._events_fp.write(line)
+            self._events_fp.flush() # Hand it to the OS; fsync is left for shutdown
+        except OSError as e:
+            print(f"Failed to write event log: {e}")
+
+    def _close_events(self, sync=False):
+        """Runs on the writer thread."""
+        if self._events_fp is None:
+            return
+        try:
+            if sync:
+                os.fsync(self._events_fp.fileno())
+            self._events_fp.close()
+        except OSError as e:
+            print(f"Failed to close event log: {e}")
+        self._events_fp = None
+
+    def _rotate_events(self, path):
+        """Runs on the writer thread. Keeps one backup so a restart still sees EVENT_LOG_MAX events."""
+        self._close_events() # The next append reopens a fresh file
+        try:
+            os.replace(path, path + '.1')
+        except OSError as e:
+            print(f"Failed to rotate event log: {e}")
+
+    def schedule_save(self):
+        """
+        Coalesces bursts of changes into a single save_history() call,
+        500 ms after the last one but at most 2 s after the first, so a
+        flapping cable can't postpone the save indefinitely.
+        """
+        now = time.monotonic()
+        if self._save_pending:
+            GLib.source_remove(self._save_pending)
+        else:
+            self._save_first = now
+        remaining_ms = int((self._save_first + 2 - now) * 1000)
+        self._save_pending = GLib.timeout_add(max(0, min(500, remaining_ms)), self._flush_save)
+
+    def _flush_save(self):
+        self._save_pending = 0
+        self.save_history()
+        return False # One-shot
+
+    def flush_save(self):
+        """Writes any pending save immediately."""
+        if self._save_pending:
+            GLib.source_remove(self._save_pending)
+            self._flush_save()
+
+    def on_close_request(self, win):
+        self.flush_save()
+        return False # Continue closing
 
     def on_history_clicked(self, btn):
         if self.active_history_window:
@@ -794,118 +1175,232 @@ class MainWindow(Gtk.ApplicationWindow):
         self.active_history_window = None
         return False # Continue closing
 
-    def on_left_selected(self, listbox, row):
-        if row is not None:
-            self.list_right.select_row(None) # Deselect right
+    def on_left_selected(self, selection, pspec):
+        if selection.get_selected_item() is not None:
+            self.sel_right.unselect_all() # Deselect right
 
-    def on_right_selected(self, listbox, row):
-        if row is not None:
-            self.list_left.select_row(None) # Deselect left
+    def on_right_selected(self, selection, pspec):
+        if selection.get_selected_item() is not None:
+            self.sel_left.unselect_all() # Deselect left
 
-    def refresh_devices(self):
-        # Clear lists
-        for lb in [self.list_left, self.list_right]:
-            child = lb.get_first_child()
-            while child:
-                lb.remove(child)
-                child = lb.get_first_child()
-            
-        devices = self.device_manager.list_devices()
-        
-        # Populate
-        if not devices:
-            # Add placeholders
-            lbl = Gtk.Label(label="No USB devices connected.")
-            lbl.set_margin_top(20)
-            self.list_right.append(lbl)
-            
-            lbl2 = Gtk.Label(label="No known devices connected.")
-            lbl2.set_margin_top(20)
-            self.list_left.append(lbl2)
+    def _show_placeholder(self, stack, label, text, dim=False):
+        if text is None:
+            stack.set_visible_child_name("list")
+            return
+        label.set_text(text)
+        label.set_opacity(0.6 if dim else 1.0)
+        stack.set_visible_child_name("empty")
+
+    def _is_known_device(self, item, *user_data):
+        return item.device.stable_id in self._history_ids
+
+    def _sync_devices(self, devices):
+        """
+        Diffs device_store against devices (sys_path -> USBDevice).
+        Only rows that appeared or disappeared touch the store; when the
+        device set is unchanged (the common case) the store isn't mutated at all.
+        """
+        items = self._device_items
+        removed = items.keys() - devices.keys()
+        # A different device on the same port gets a new item, so the history filter sees it
+        removed.update(sys_path for sys_path in items.keys() & devices.keys()
+                       if items[sys_path].device.stable_id != devices[sys_path].stable_id)
+        if removed:
+            self._remove_items(removed)
+            for old_id in removed:
+                del items[old_id]
+        
+        added = []
+        for sys_path, dev in devices.items():
+            item = items.get(sys_path)
+            if item is None:
+                item = DeviceItem(dev)
+                items[sys_path] = item
+                added.append(item)
+            else:
+                item.update(dev)
+        self._append_items(added)
+
+    def _remove_items(self, sys_paths):
+        """Removes the DeviceItems for sys_paths from device_store."""
+        store = self.device_store
+        # One pass from the end, so earlier positions stay valid while removing
+        for pos in range(store.get_n_items() - 1, -1, -1):
+            if store.get_item(pos).device.sys_path in sys_paths:
+                store.remove(pos)
+
+    def _append_items(self, items):
+        # One items-changed signal for all new rows
+        if items:
+            self.device_store.splice(self.device_store.get_n_items(), 0, items)
+
+    def _update_placeholders(self):
+        if self.device_store.get_n_items() == 0:
+            self._show_placeholder(self.stack_right, self.lbl_right_empty, "No USB devices connected.")
+            self._show_placeholder(self.stack_left, self.lbl_left_empty, "No known devices connected.")
             return
         
-        # Track seen IDs for left list to avoid duplicates if multiple connections? 
-        # Requirement: "only show CONNECTED devices... previously monitored"
-        
-        count_left = 0
-        
-        for dev in devices:
-            # Always add to Right List (All Devices)
-            row_right = DeviceRow(dev)
-            self.list_right.append(row_right)
-            
-            # Check for Left List (History)
-            # device_history keys are stable_ids
-            if dev.stable_id in self.device_history:
-                row_left = DeviceRow(dev)
-                self.list_left.append(row_left)
-                count_left += 1
-                
-        if count_left == 0:
-             lbl = Gtk.Label(label="No previously monitored devices found.")
-             lbl.set_margin_top(20)
-             lbl.set_opacity(0.6)
-             self.list_left.append(lbl)
+        self._show_placeholder(self.stack_right, self.lbl_right_empty, None)
+        if self.known_devices.get_n_items() == 0:
+            self._show_placeholder(self.stack_left, self.lbl_left_empty,
+                                   "No previously monitored devices found.", dim=True)
+        else:
+            self._show_placeholder(self.stack_left, self.lbl_left_empty, None)
+
+    def refresh_devices(self):
+        # A full resync is rare and usually user-initiated, so read the hardware again
+        devices = self.device_manager.list_devices(fresh=True)
+        self._sync_devices({dev.sys_path: dev for dev in devices})
+        
+        # device_history may have grown while monitoring. Entries are never removed,
+        # so the filter only re-runs when ids were added, and only ever matches more.
+        if len(self.device_history) != len(self._history_ids):
+            self._history_ids.update(self.device_history)
+            self.history_filter.changed(Gtk.FilterChange.LESS_STRICT)
+        self._update_placeholders()
+
+    def apply_device_events(self, changes):
+        """
+        Patches the device rows from a batch of udev events (sys_path -> (action, device),
+        last action wins), without re-enumerating every USB device. refresh_devices()
+        stays the full resync (startup, the Refresh button, returning from monitoring).
+        """
+        items = self._device_items
+        removed = set()
+        added = []
+        for sys_path, (action, device) in changes.items():
+            if action == 'add':
+                item = items.get(sys_path)
+                if item is not None and item.device.stable_id != device.stable_id:
+                    # A different device on the same port; replace its row (see _sync_devices)
+                    del items[sys_path]
+                    removed.add(sys_path)
+                    item = None
+                if item is None:
+                    item = DeviceItem(device)
+                    items[sys_path] = item
+                    added.append(item) # The history filter picks it up for the left list
+                else:
+                    item.update(device)
+            elif action == 'remove' and items.pop(sys_path, None) is not None:
+                removed.add(sys_path)
+        
+        if removed:
+            self._remove_items(removed)
+        self._append_items(added)
+        self._update_placeholders()
 
     def on_monitor_clicked(self, btn):
         # Determine selection
-        target_row = self.list_left.get_selected_row() or self.list_right.get_selected_row()
+        target_item = self.sel_left.get_selected_item() or self.sel_right.get_selected_item()
         
-        if target_row and isinstance(target_row, DeviceRow):
-            self.page_monitoring.set_target(target_row.device)
+        if target_item is not None:
+            self.page_monitoring.set_target(target_item.device)
             self.stack.set_visible_child_name("monitoring")
 
     def stop_monitoring(self):
         self.stack.set_visible_child_name("selection")
         self.refresh_devices()
 
-    def on_device_event_threadsafe(self, action, device):
-        # Called from background thread -> Marshal to main thread
-        GLib.idle_add(self.handle_device_event, action, device)
+    def _now_hms(self):
+        """Local "HH:MM:SS", formatted at most once per second (event bursts share it)."""
+        t = int(time.time())
+        if t != self._last_sec:
+            ts = time.localtime(t)
+            self._last_hms = f"{ts.tm_hour:02d}:{ts.tm_min:02d}:{ts.tm_sec:02d}"
+            self._last_sec = t
+        return self._last_hms
 
     def handle_device_event(self, action, device):
-        # Debug log
-        print(f"DEBUG: Event '{action}' for device '{device.stable_id}'")
+        logger.debug("Event %r for device %r", action, device.stable_id)
         
+        # A hub attaching sends dozens of events within milliseconds; collect them
+        # and apply the whole burst at once
+        self._pending_events.append((action, device))
+        if self._coalesce_source is None:
+            self._coalesce_source = GLib.timeout_add(50, self._flush_events)
+
+    def _flush_events(self):
+        self._coalesce_source = None
+        events, self._pending_events = self._pending_events, []
+        
+        # Every event is still logged; only the UI work is done once per batch
+        for action, device in events:
+            log_entry = self._record_event(action, device)
+            if self.active_history_window:
+                self.active_history_window.add_event(log_entry)
+        
+        # Live Update History Window if open
+        if self.active_history_window:
+            self.active_history_window.refresh_registry()
+        
+        # Auto-save on event to ensure persistence
+        self.schedule_save()
+        
+        # If in selection mode, patch the lists with the net change per device.
+        # An add and remove of the same device within the batch cancel out.
+        if self.stack.get_visible_child_name() == "selection":
+            changes = {}
+            for action, device in events:
+                if action in ['add', 'remove']:
+                    changes[device.sys_path] = (action, device)
+            if changes:
+                self.apply_device_events(changes)
+                
+        # If in monitoring mode, only the target's latest state matters
+        elif self.stack.get_visible_child_name() == "monitoring":
+            target_id = self.page_monitoring.current_target_id
+            
+            # Strict Matching Logic
+            for action, device in reversed(events):
+                if device.stable_id != target_id:
+                    continue
+                if action == 'add' or action == 'bind' or action == 'change':
+                    # Reconnected or Properties Changed!
+                    self.page_monitoring.update_view(device, connected=True)
+                    break
+                elif action == 'remove' or action == 'unbind':
+                    # Disconnected!
+                    self.page_monitoring.update_view(device, connected=False)
+                    break
+        return False # One-shot
+
+    def _record_event(self, action, device):
+        """Updates the registry and event log for one event and returns the log entry."""
         # --- History Tracking ---
         # 1. Update Registry
-        now_str = datetime.datetime.now().strftime("%H:%M:%S")
+        now_str = self._now_hms()
         
-        # Helper: Clean Name Logic
-        friendly_name = device.get_friendly_name()
-        is_unknown_name = "----:----" in friendly_name or "Unknown" in friendly_name
+        # Helper: Clean Name Logic (both computed once per USBDevice)
+        friendly_name = device.friendly_name
+        is_unknown_name = device.is_unknown_name
         
-        # If we have a better name in registry, use it (especially for remove events)
-        if is_unknown_name and device.stable_id in self.device_registry:
-            friendly_name = self.device_registry[device.stable_id]['name']
-
-        if device.stable_id not in self.device_registry:
-            # Only add to registry if we have a decent name, or if it's the first time
-            self.device_registry[device.stable_id] = {
+        reg_entry = self.device_registry.get(device.stable_id)
+        if reg_entry is None:
+            # First time: take whatever name we have
+            reg_entry = self.device_registry[device.stable_id] = {
                 'name': friendly_name,
-                'speeds': set(),
+                'speeds': [],
                 'last_seen': now_str
             }
+        elif is_unknown_name:
+            # We have a better name in registry, use it (especially for remove events)
+            friendly_name = reg_entry['name']
         else:
-            # Update name if the new one is BETTER (not unknown)
-            if not is_unknown_name:
-                self.device_registry[device.stable_id]['name'] = friendly_name
+            # Update name, the new one is BETTER (not unknown)
+            reg_entry['name'] = friendly_name
         
         # Update last seen
-        reg_entry = self.device_registry[device.stable_id]
         reg_entry['last_seen'] = now_str
         
-        try:
-            spd = int(device.speed)
-            reg_entry['speeds'].add(spd)
-        except:
-            pass
+        spd = device.speed_int
+        if spd is not None:
+            speeds = reg_entry['speeds']
+            if spd not in speeds:
+                bisect.insort(speeds, spd)
             
         # 2. Add to Event Log
-        evt_type = "Changed"
-        if action == 'add': evt_type = "Connected"
-        elif action == 'remove': evt_type = "Disconnected"
-        elif action == 'change': evt_type = "Changed"
+        evt_type = _EVENT_TYPES.get(action, EVENT_CHANGED)
         
         # Fix Speed Display for Disconnects
         speed_display = format_speed(device.speed)[0]
@@ -915,43 +1410,20 @@ class MainWindow(Gtk.ApplicationWindow):
         log_entry = {
             'time': now_str,
             'event': evt_type,
-            'device_name': friendly_name, # Use our cleaned name
+            'device_name': sys.intern(friendly_name), # Use our cleaned name
             'speed': speed_display,
-            'bus': f"{device.bus_num}-{device.sys_name}",
-            'version': device.version
+            'bus': sys.intern(f"{device.bus_num}-{device.sys_name}"),
+            'version': sys.intern(device.version)
         }
         self.event_log.append(log_entry)
-        
-        # Live Update History Window if open
-        if self.active_history_window:
-            self.active_history_window.add_event_to_list(log_entry, at_top=True)
-            self.active_history_window.refresh_registry()
-        
-        # Auto-save on event to ensure persistence
-        self.save_history()
-        
-        # If in selection mode, maybe auto-refresh?
-        if self.stack.get_visible_child_name() == "selection":
-            if action in ['add', 'remove']:
-                self.refresh_devices()
-                
-        # If in monitoring mode, check if it affects our target
-        elif self.stack.get_visible_child_name() == "monitoring":
-            target_id = self.page_monitoring.current_target_id
-            
-            # Strict Matching Logic
-            if device.stable_id == target_id:
-                if action == 'add' or action == 'bind' or action == 'change':
-                    # Reconnected or Properties Changed!
-                    self.page_monitoring.update_view(device, connected=True)
-                elif action == 'remove' or action == 'unbind':
-                    # Disconnected!
-                    self.page_monitoring.update_view(device, connected=False)
-
-        def do_shutdown(self):
-
-            self.save_history()
-
-            self.device_manager.stop_monitoring()
+        self._append_event(log_entry)
+        return log_entry
 
-    
\ No newline at end of file
+    def do_shutdown(self):
+        if self._coalesce_source is not None:
+            GLib.source_remove(self._coalesce_source)
+            self._flush_events() # Record events still waiting for the timer
+        self.flush_save()
+        self._save_executor.submit(self._close_events, True)
+        self._save_executor.shutdown(wait=True) # Let the last write finish
+        self.device_manager.stop_monitoring()
@@ -1,5 +1,33 @@
+import functools
+
 # Helper functions for UI formatting
+# Both are pure and return immutable str/tuple values, so results are safe to cache
+# and share between callers. Inputs are the handful of speed/version strings sysfs reports.
+
+# Standard signaling rates (Mbps) -> (formatted speed, USB marketing name)
+_SPEED_TABLE = {
+    1: ("1.5 Mbps", "USB 1.1 Low Speed"), # 1.5 rounded
+    12: ("12 Mbps", "USB 1.1 Full Speed"),
+    480: ("480 Mbps", "USB 2.0 High Speed"),
+    5000: ("5 Gbps", "USB 3.2 Gen 1 (SuperSpeed)"),
+    10000: ("10 Gbps", "USB 3.2 Gen 2 (SuperSpeed+)"),
+    20000: ("20 Gbps", "USB 3.2 Gen 2x2 (SuperSpeed+ 20G)"),
+    40000: ("40 Gbps", "USB4 Gen 3x2"),
+    80000: ("80 Gbps", "USB4 Gen 4 (USB4 v2)"),
+}
+
+# sysfs protocol version prefix -> friendly name
+_VERSION_TABLE = {
+    "1.1": "USB 1.1",
+    "2.0": "USB 2.0",
+    "2.1": "USB 2.1",
+    "3.0": "USB 3.0",
+    "3.1": "USB 3.1",
+    "3.2": "USB 3.2",
+    "4.0": "USB4",
+}
 
+@functools.lru_cache(maxsize=32)
 def format_speed(speed_mbps_str: str) -> str:
     """
     Converts raw Mbps string (e.g. "5000") to human-readable format (e.g. "5 Gbps").
@@ -14,28 +42,16 @@ def format_speed(speed_mbps_str: str) -> str:
         return speed_mbps_str, ""
 
     # Specific Matches based on standard signaling rates and marketing names
-    if mbps == 1: # 1.5 rounded
-        return "1.5 Mbps", "USB 1.1 Low Speed"
-    if mbps == 12:
-        return "12 Mbps", "USB 1.1 Full Speed"
-    if mbps == 480:
-        return "480 Mbps", "USB 2.0 High Speed"
-    if mbps == 5000:
-        return "5 Gbps", "USB 3.2 Gen 1 (SuperSpeed)"
-    if mbps == 10000:
-        return "10 Gbps", "USB 3.2 Gen 2 (SuperSpeed+)"
-    if mbps == 20000:
-        return "20 Gbps", "USB 3.2 Gen 2x2 (SuperSpeed+ 20G)"
-    if mbps == 40000:
-        return "40 Gbps", "USB4 Gen 3x2"
-    if mbps == 80000:
-        return "80 Gbps", "USB4 Gen 4 (USB4 v2)"
+    known = _SPEED_TABLE.get(mbps)
+    if known is not None:
+        return known
     
     if mbps >= 1000:
         return f"{mbps/1000:g} Gbps", ""
     
     return f"{mbps} Mbps", ""
 
+@functools.lru_cache(maxsize=32)
 def get_usb_version_label(version_str: str) -> str:
     """
     Maps sysfs version string to detailed friendly name.
@@ -45,60 +61,88 @@ def get_usb_version_label(version_str: str) -> str:
     
     v = version_str.strip()
     # Note: version string from kernel reflects the protocol version, not necessarily the speed
-    if v.startswith("1.1"): return "USB 1.1"
-    if v.startswith("2.0"): return "USB 2.0"
-    if v.startswith("2.1"): return "USB 2.1"
-    if v.startswith("3.0"): return "USB 3.0"
-    if v.startswith("3.1"): return "USB 3.1"
-    if v.startswith("3.2"): return "USB 3.2"
-    if v.startswith("4.0"): return "USB4"
-    
-    return f"USB {v}"
+    return _VERSION_TABLE.get(v[:3], f"USB {v}")
 
+import urllib.error
 import urllib.request
 import json
+import os
 import threading
+from itertools import zip_longest
 
 class UpdateChecker:
     REPO_URL = "https://api.github.com/repos/meliorisse/CordIDMonitor/releases/latest"
+    # Last release seen plus its ETag, so repeat checks are answered with 304 and no body
+    CACHE_FILE = os.path.expanduser("~/.cache/cord_id_monitor/release.json")
     
     @staticmethod
     def check_for_updates(current_version, on_update_found):
         """
-        Checks for updates in a background thread.
+        Checks for updates in a background thread and returns immediately.
+        Network I/O and JSON parsing never run on the caller's (GTK) thread.
         :param current_version: The current version string (e.g. "0.1.0")
-        :param on_update_found: Callback(latest_version, download_url)
+        :param on_update_found: Callback(latest_version, download_url).
+                                Invoked on the worker thread; GUI callers must
+                                marshal back to the main loop (e.g. GLib.idle_add).
         """
         def _check():
             try:
+                cached = UpdateChecker._load_cache()
                 # Set User-Agent to avoid 403 Forbidden
-                req = urllib.request.Request(
-                    UpdateChecker.REPO_URL, 
-                    headers={'User-Agent': 'CordIDMonitor'}
-                )
-                with urllib.request.urlopen(req, timeout=5) as response:
-                    data = json.loads(response.read().decode())
-                    tag_name = data.get('tag_name', '').lstrip('v')
-                    
-                    if UpdateChecker._is_newer(current_version, tag_name):
-                        html_url = data.get('html_url', '')
-                        on_update_found(tag_name, html_url)
+                headers = {'User-Agent': 'CordIDMonitor', 'Accept': 'application/vnd.github+json'}
+                if cached.get('etag'):
+                    headers['If-None-Match'] = cached['etag']
+                req = urllib.request.Request(UpdateChecker.REPO_URL, headers=headers)
+                
+                try:
+                    with urllib.request.urlopen(req, timeout=5) as response:
+                        data = json.loads(response.read().decode())
+                        release = {
+                            'etag': response.headers.get('ETag'),
+                            'tag_name': data.get('tag_name', ''),
+                            'html_url': data.get('html_url', '')
+                        }
+                    UpdateChecker._save_cache(release)
+                except urllib.error.HTTPError as e:
+                    if e.code != 304:
+                        raise
+                    release = cached # Not Modified: the cached release is still the latest
+                
+                tag_name = release.get('tag_name', '').lstrip('v')
+                if UpdateChecker._is_newer(current_version, tag_name):
+                    on_update_found(tag_name, release.get('html_url', ''))
             except Exception as e:
                 print(f"Update check failed: {e}")
 
-        threading.Thread(target=_check, daemon=True).start()
+        threading.Thread(target=_check, name="UpdateChecker", daemon=True).start()
+
+    @staticmethod
+    def _load_cache():
+        try:
+            with open(UpdateChecker.CACHE_FILE, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _save_cache(release):
+        try:
+            os.makedirs(os.path.dirname(UpdateChecker.CACHE_FILE), exist_ok=True)
+            with open(UpdateChecker.CACHE_FILE, 'w') as f:
+                json.dump(release, f)
+        except OSError as e:
+            print(f"Could not cache release info: {e}")
 
     @staticmethod
     def _is_newer(current, latest):
-        # specific to version format "x.y.z"
+        # specific to version format "x.y.z"; missing components count as 0
         try:
-            c_parts = [int(x) for x in current.split('.')]
-            l_parts = [int(x) for x in latest.split('.')]
-            
-            # Normalize length
-            while len(c_parts) < 3: c_parts.append(0)
-            while len(l_parts) < 3: l_parts.append(0)
+            c_parts = tuple(int(x) for x in current.split('.'))
+            l_parts = tuple(int(x) for x in latest.split('.'))
             
-            return l_parts > c_parts
-        except:
+            for c, l in zip_longest(c_parts, l_parts, fillvalue=0):
+                if l != c:
+                    return l > c
+            return False
+        except (ValueError, AttributeError): # A non-numeric component, or no tag name at all
             return False